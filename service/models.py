@@ -40,6 +40,18 @@ class PersistentBase:
         db.session.add(self)
         db.session.commit()
 
+    @classmethod
+    def create_batch(cls, records):
+        """
+        Creates a batch of records in the database with a single commit
+        """
+        logger.info("Creating %d %s records", len(records), cls.__name__)
+        for record in records:
+            record.id = None  # id must be none to generate next primary key
+        # return_defaults fetches the generated ids back onto the records
+        db.session.bulk_save_objects(records, return_defaults=True)
+        db.session.commit()
+
     def update(self):
         """
         Updates a Account to the database
@@ -58,6 +58,28 @@ def create_accounts():
     )
 
 
+######################################################################
+# CREATE ACCOUNTS IN BULK
+######################################################################
+@app.route("/accounts/bulk", methods=["POST"])
+def create_accounts_bulk():
+    """
+    Creates a batch of Accounts
+    This endpoint will create every Account in the list
+    posted in the body with a single database commit
+    """
+    app.logger.info("Request to create Accounts in bulk")
+    check_content_type("application/json")
+    data = request.get_json()
+    if not isinstance(data, list):
+        abort(status.HTTP_400_BAD_REQUEST,
+              "Request body must be a list of Accounts")
+    accounts = [Account().deserialize(item) for item in data]
+    Account.create_batch(accounts)
+    message = [account.serialize() for account in accounts]
+    return make_response(jsonify(message), status.HTTP_201_CREATED)
+
+
 ######################################################################
 # READ AN ACCOUNT
 ######################################################################
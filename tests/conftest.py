@@ -0,0 +1,178 @@
+"""
+Test configuration shared by the whole test suite
+
+When the suite is run under pytest-xdist every worker gets its own
+database so that tests on different workers never see each other's rows:
+  pytest -n auto --dist=loadfile
+
+The service package is only imported inside the fixtures so that it
+connects to the database chosen by pytest_configure.
+"""
+# pylint: disable=import-outside-toplevel, redefined-outer-name
+import os
+import logging
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+
+# Tests run against an in-memory sqlite database unless DATABASE_URI
+# points them at Postgres, as the CI build does
+DATABASE_URI = os.getenv("DATABASE_URI", "sqlite://")
+
+# A small pool of long lived connections per worker, the test database
+# is local so there is no need to ping or recycle them
+POSTGRES_ENGINE_OPTIONS = {
+    "pool_size": 4,
+    "max_overflow": 0,
+    "pool_pre_ping": False,
+    "pool_recycle": -1,
+}
+
+# Talisman options that only the security header tests need
+TALISMAN_HEADER_OPTIONS = ("content_security_policy", "frame_options")
+
+
+######################################################################
+#  H E L P E R   F U N C T I O N S
+######################################################################
+def worker_database_uri(database_uri, worker_id):
+    """Returns the database uri private to an xdist worker"""
+    url = make_url(database_uri)
+    if not url.database or url.database == ":memory:":
+        return database_uri  # in-memory databases are already private
+    if url.get_backend_name() == "sqlite":
+        root, ext = os.path.splitext(url.database)
+        return str(url.set(database=f"{root}_{worker_id}{ext}"))
+    return str(url.set(database=f"{url.database}_{worker_id}"))
+
+
+def create_database(database_uri, worker_uri):
+    """Creates the worker database on the server if it does not exist"""
+    worker_url = make_url(worker_uri)
+    if worker_url.get_backend_name() != "postgresql":
+        return  # sqlite creates the database file on first connect
+    # CREATE DATABASE cannot run inside a transaction block
+    engine = create_engine(database_uri, isolation_level="AUTOCOMMIT")
+    with engine.connect() as connection:
+        exists = connection.execute(
+            text("SELECT 1 FROM pg_database WHERE datname = :name"),
+            {"name": worker_url.database},
+        ).scalar()
+        if not exists:
+            connection.execute(text(f'CREATE DATABASE "{worker_url.database}"'))
+    engine.dispose()
+
+
+######################################################################
+#  P Y T E S T   H O O K S
+######################################################################
+def pytest_configure(config):  # pylint: disable=unused-argument
+    """Points the service, and each xdist worker, at the test database"""
+    # The service and the test modules read DATABASE_URI when they are
+    # imported, which happens after this hook runs
+    os.environ["DATABASE_URI"] = DATABASE_URI
+    worker_id = os.getenv("PYTEST_XDIST_WORKER")
+    if not worker_id:
+        return  # not running under xdist
+    worker_uri = worker_database_uri(DATABASE_URI, worker_id)
+    create_database(DATABASE_URI, worker_uri)
+    os.environ["DATABASE_URI"] = worker_uri
+
+
+######################################################################
+#  F I X T U R E S
+######################################################################
+@pytest.fixture(scope="session")
+def app():
+    """The Flask app configured for testing, initialized once per session"""
+    from service import app as flask_app
+    from service.models import db, Account, init_db
+
+    database_uri = os.getenv("DATABASE_URI", DATABASE_URI)
+    flask_app.config.update(
+        TESTING=True,
+        DEBUG=False,
+        SQLALCHEMY_DATABASE_URI=database_uri,
+    )
+    if make_url(database_uri).get_backend_name() == "postgresql":
+        # sqlite uses its own pool classes which take none of these options
+        flask_app.config["SQLALCHEMY_ENGINE_OPTIONS"] = POSTGRES_ENGINE_OPTIONS
+    flask_app.logger.setLevel(logging.CRITICAL)
+    init_db(flask_app)  # creates a new engine from the options above
+    db.session.query(Account).delete()  # start from an empty table
+    db.session.commit()
+    db.session.remove()
+    # Requests made by the test client reuse this app context instead of
+    # pushing and popping one of their own
+    with flask_app.app_context():
+        yield flask_app
+
+
+@pytest.fixture(scope="session")
+def talisman_defaults(app):  # pylint: disable=unused-argument
+    """Turns off the Talisman header options and returns their defaults
+
+    Most tests never look at the security headers so Talisman does not
+    need to build the policy strings for every response.
+    """
+    from service import talisman
+
+    defaults = {
+        name: getattr(talisman, name) for name in TALISMAN_HEADER_OPTIONS
+    }
+    for name in TALISMAN_HEADER_OPTIONS:
+        setattr(talisman, name, None)
+    yield defaults
+    for name, value in defaults.items():
+        setattr(talisman, name, value)
+
+
+@pytest.fixture(scope="session")
+def client(app, talisman_defaults):  # pylint: disable=unused-argument
+    """A test client shared by every test in the session"""
+    from service import talisman
+
+    talisman.force_https = False    # to disable https for tests
+    return app.test_client()
+
+
+@pytest.fixture
+def security_headers(talisman_defaults):
+    """Turns the Talisman header options back on for a single test"""
+    from service import talisman
+
+    for name, value in talisman_defaults.items():
+        setattr(talisman, name, value)
+    yield
+    for name in talisman_defaults:
+        setattr(talisman, name, None)
+
+
+@pytest.fixture(scope="session")
+def connection(app):  # pylint: disable=unused-argument
+    """A database connection shared by every test in the session"""
+    from service.models import db
+
+    connection = db.engine.connect()
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def db_session(connection):
+    """Binds db.session to a transaction that is rolled back after the test
+
+    The commits made by the service never reach the database so there is
+    nothing to clean up between tests.
+    """
+    from service.models import db
+
+    transaction = connection.begin()
+    session = db.session
+    db.session = db.create_scoped_session(
+        options={"bind": connection, "binds": {}}
+    )
+    yield db.session
+    db.session.remove()
+    db.session = session
+    transaction.rollback()